@@ -19,7 +19,7 @@ import difflib
 import itertools
 import pathlib
 import tomllib
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 
 import tomlkit
 
@@ -41,6 +41,14 @@ class Config:
     A helper classmethod for parsing network config files is provided. See `parse_network_config`.
     """
 
+    # Special cases: Sequential station codes on the same line that are not linked.
+    __unlinked_station_code_pairs: frozenset[tuple[str, str]] = frozenset(
+        {
+            ("BP13", "BP14"),
+            ("NS4", "NS13"),
+        }
+    )
+
     def __init__(self, stage: Stage):
         """Setup network `Config` based on `stage`.
 
@@ -51,16 +59,18 @@ class Config:
         self.stations: list[SingaporeStation] = self._get_stations()
 
         # Station lookup tables.
-        self._station_codes_by_station_name: dict[str, set[str]] = defaultdict(set)
+        # Station codes are appended in sorted order, as `self.stations` is sorted.
+        self._station_codes_by_station_name: dict[str, list[str]] = defaultdict(list)
         for station in self.stations:
-            self._station_codes_by_station_name[station.station_name].add(
+            self._station_codes_by_station_name[station.station_name].append(
                 station.station_code
             )
-        self._stations_by_line_code: defaultdict[str, set[SingaporeStation]] = (
-            defaultdict(set)
+        # Stations are appended in sorted order, as `self.stations` is sorted.
+        self._stations_by_line_code: defaultdict[str, list[SingaporeStation]] = (
+            defaultdict(list)
         )
         for station in self.stations:
-            self._stations_by_line_code[station.line_code].add(station)
+            self._stations_by_line_code[station.line_code].append(station)
 
         # Network config sections.
         self.station_code_to_station: dict[str, SingaporeStation] = {
@@ -69,10 +79,10 @@ class Config:
         self.non_linear_line_terminals: dict[str, set[str]] = (
             self._generate_non_linear_line_terminals()
         )
-        self.segment_adjacency_matrix: defaultdict[str, OrderedDict[str, dict]] = (
+        self.segment_adjacency_matrix: dict[str, dict[str, dict]] = (
             self._generate_segment_adjacency_matrix()
         )
-        self.transfer_adjacency_matrix: defaultdict[str, OrderedDict[str, dict]] = (
+        self.transfer_adjacency_matrix: dict[str, dict[str, dict]] = (
             self._generate_transfer_adjacency_matrix()
         )
         self.conditional_transfers: dict[str, dict[str, int]] = (
@@ -99,38 +109,32 @@ class Config:
 
     def _generate_segment_adjacency_matrix(
         self,
-    ) -> defaultdict[str, OrderedDict[str, dict]]:
+    ) -> dict[str, dict[str, dict]]:
         """Create an travel time / dwell time adjacency matrix for all segments between stations with different names
         on the network.
 
         Returns:
-            defaultdict[str, OrderedDict[str, dict]]: Travel time adjacency matrix.
+            dict[str, dict[str, dict]]: Travel time adjacency matrix.
         """
         # Uni-directionally link up adjacent stations on same line based on the fact that most adjacent stations
         # are arranged by station code in sequential order (same line code and in ascending station number order).
         # Some stations in non-sequential order will not be linked up, like BP6-BP13, which all happen to be conditional
         # transfer segments.
-        adjacency_matrix: defaultdict[str, OrderedDict[str, dict]] = defaultdict(
-            OrderedDict
-        )
-        for stations in self._stations_by_line_code.values():
-            line_stations = sorted(
-                stations,
-                key=SingaporeStation.sort_key,
-            )
-            for station, next_station in zip(line_stations[:-1], line_stations[1:]):
+        adjacency_matrix: dict[str, dict[str, dict]] = {}
+        train_segments = TrainSegments.train_segments  # Station code pair -> duration.
+        for line_stations in self._stations_by_line_code.values():
+            for station, next_station in itertools.pairwise(line_stations):
                 station_code, next_station_code = (
                     station.station_code,
                     next_station.station_code,
                 )
-                if (station_code, next_station_code) == ("BP13", "BP14"):
-                    continue  # Special case: No link between BP13 and BP14.
-                if (station_code, next_station_code) == ("NS4", "NS13"):
-                    continue  # Special case: No link between NS4 and NS13.
-                duration = TrainSegments.train_segments[
-                    f"{station_code}-{next_station_code}"
-                ]["duration"]
-                adjacency_matrix[station_code][next_station_code] = {
+                if (
+                    station_code,
+                    next_station_code,
+                ) in Config.__unlinked_station_code_pairs:
+                    continue
+                duration = train_segments[(station_code, next_station_code)]
+                adjacency_matrix.setdefault(station_code, {})[next_station_code] = {
                     "duration_asc": duration,
                     "duration_desc": duration,
                 }  # Assume duration for both directions is the same.
@@ -142,10 +146,8 @@ class Config:
         ):
             # Special case: EWL still part of NSL.
             station_code, next_station_code = "EW15", "NS26"
-            duration = TrainSegments.train_segments[
-                f"{station_code}-{next_station_code}"
-            ]["duration"]
-            adjacency_matrix[station_code][next_station_code] = {
+            duration = train_segments[(station_code, next_station_code)]
+            adjacency_matrix.setdefault(station_code, {})[next_station_code] = {
                 "duration_asc": duration,
                 "duration_desc": duration,
             }  # Assume duration for both directions is the same.
@@ -153,10 +155,8 @@ class Config:
         if "DE1" in self.station_code_to_station:
             # Special case: Downtown Line 2 Extension.
             station_code, next_station_code = "DE1", "DT1"
-            duration = TrainSegments.train_segments[
-                f"{station_code}-{next_station_code}"
-            ]["duration"]
-            adjacency_matrix[station_code][next_station_code] = {
+            duration = train_segments[(station_code, next_station_code)]
+            adjacency_matrix.setdefault(station_code, {})[next_station_code] = {
                 "duration_asc": duration,
                 "duration_desc": duration,
             }  # Assume duration for both directions is the same.
@@ -167,43 +167,52 @@ class Config:
         )
         interchange_station_codes: set[str] = {
             station.station_code
-            for station in set().union(
-                *SingaporeStation.get_interchanges(self.stations)
-            )
+            for interchange in SingaporeStation.get_interchanges(self.stations)
+            for station in interchange
         }
-        for station_code in adjacency_matrix:
-            for next_station_code in adjacency_matrix[station_code]:
-                dwell_time_asc, dwell_time_desc = DwellTime.get_dwell_time(
+        for station_code, next_station_codes in adjacency_matrix.items():
+            for next_station_code, segment_details in next_station_codes.items():
+                (
+                    segment_details["dwell_time_asc"],
+                    segment_details["dwell_time_desc"],
+                ) = DwellTime.get_dwell_time(
                     terminal_station_codes,
                     interchange_station_codes,
                     station_code,
                     next_station_code,
                 )
-                adjacency_matrix[station_code][next_station_code].update(
-                    {
-                        "dwell_time_asc": dwell_time_asc,
-                        "dwell_time_desc": dwell_time_desc,
-                    }
-                )
 
         # Add walking segments from LTA Walking Train Map (WTM)
-        for start_station_name, end_station_name, duration in Walks.routes:
-            for start_station_code in self._station_codes_by_station_name[
-                start_station_name
-            ]:
-                for end_station_code in self._station_codes_by_station_name[
-                    end_station_name
-                ]:
-                    adjacency_matrix[start_station_code][end_station_code] = {
-                        "duration_asc": duration,
-                        "duration_desc": duration,
-                        "mode": "walk",
-                        "dwell_time_asc": 0,
-                        "dwell_time_desc": 0,
-                    }  # No dwell time for walking routes. Assume duration for both directions is the same.
+        # `.get` avoids inserting empty entries into the lookup table for stations not yet open.
+        station_codes_by_station_name = self._station_codes_by_station_name
+        walks = [
+            (start_station_code, end_station_code, duration)
+            for start_station_name, end_station_name, duration in Walks.routes
+            for start_station_code in station_codes_by_station_name.get(
+                start_station_name, ()
+            )
+            for end_station_code in station_codes_by_station_name.get(
+                end_station_name, ()
+            )
+        ]
+        for start_station_code, end_station_code, duration in walks:
+            adjacency_matrix.setdefault(start_station_code, {})[end_station_code] = {
+                "duration_asc": duration,
+                "duration_desc": duration,
+                "mode": "walk",
+                "dwell_time_asc": 0,
+                "dwell_time_desc": 0,
+            }  # No dwell time for walking routes. Assume duration for both directions is the same.
 
         # Create and mark conditional transfer segments. All non sequential segments are coincidentally
         # conditional transfer segments.
+        conditional_interchange_station_codes: dict[str, set[str]] = {
+            station_code: interchange_station_codes.union({station_code})
+            for station_code in {
+                segment.interchange_station_code
+                for segment in ConditionalTransfers.conditional_transfer_segments
+            }
+        }  # Built once per conditional interchange instead of once per segment.
         for segment in ConditionalTransfers.conditional_transfer_segments:
             if (
                 isinstance(segment.defunct_with_station_code, str)
@@ -217,14 +226,14 @@ class Config:
             ):
                 dwell_time_asc, dwell_time_desc = DwellTime.get_dwell_time(
                     terminal_station_codes,
-                    interchange_station_codes.union({segment.interchange_station_code}),
+                    conditional_interchange_station_codes[
+                        segment.interchange_station_code
+                    ],
                     station_a,
                     station_b,
                 )
-                duration = TrainSegments.train_segments[f"{station_a}-{station_b}"][
-                    "duration"
-                ]
-                adjacency_matrix[station_a][station_b] = {
+                duration = train_segments[(station_a, station_b)]
+                adjacency_matrix.setdefault(station_a, {})[station_b] = {
                     "duration_asc": duration,
                     "duration_desc": duration,
                     "edge_type": segment.edge_type,
@@ -232,73 +241,52 @@ class Config:
                     "dwell_time_desc": dwell_time_desc,
                 }
 
-        pairs = sorted(
+        segments = sorted(
             [
-                (start, end)
-                for start in adjacency_matrix
-                for end in adjacency_matrix[start]
+                (start, end, segment_details)
+                for start, end_station_codes in adjacency_matrix.items()
+                for end, segment_details in end_station_codes.items()
             ],
-            key=lambda station_codes: (
-                SingaporeStation.to_station_code_components(station_codes[0]),
-                SingaporeStation.to_station_code_components(station_codes[1]),
+            key=lambda segment: (
+                SingaporeStation.to_station_code_components(segment[0]),
+                SingaporeStation.to_station_code_components(segment[1]),
             ),
         )
 
-        sorted_adjacency_matrix: defaultdict[str, OrderedDict[str, dict]] = defaultdict(
-            OrderedDict
-        )
-        for start, end in pairs:
-            sorted_adjacency_matrix[start][end] = adjacency_matrix[start][end]
+        sorted_adjacency_matrix: dict[str, dict[str, dict]] = {}
+        for start, end, segment_details in segments:
+            sorted_adjacency_matrix.setdefault(start, {})[end] = segment_details
 
         return sorted_adjacency_matrix
 
     def _generate_transfer_adjacency_matrix(
         self,
-    ) -> defaultdict[str, OrderedDict[str, dict]]:
+    ) -> dict[str, dict[str, dict]]:
         """Create an travel time adjacency matrix for all transfers between stations with same names
         on the network.
 
         Returns:
-            defaultdict[str, OrderedDict[str, dict]]: Travel time adjacency matrix.
+            dict[str, dict[str, dict]]: Travel time adjacency matrix.
         """
-        interchanges: dict[str, set[str]] = {
-            station_name: station_codes
-            for (
-                station_name,
-                station_codes,
-            ) in self._station_codes_by_station_name.items()
-            if len(station_codes) >= 2
-        }
-        adjacency_matrix: defaultdict[str, OrderedDict[str, dict]] = defaultdict(
-            OrderedDict
-        )
-        pairs = []
-        for station_name, station_codes in interchanges.items():
-            if station_name in Transfers.interchange_transfers:
-                for start, end in itertools.combinations(
-                    sorted(
-                        station_codes, key=SingaporeStation.to_station_code_components
-                    ),
-                    2,
-                ):
-                    # Combinations on sorted set to keep pairs order predictable.
-                    pairs.append((start, end, station_name))
-                    pairs.append((end, start, station_name))
-            else:
+        adjacency_matrix: dict[str, dict[str, dict]] = {}
+        # Iterate stations in sorted order so that pairs are added in sorted order without a separate sort.
+        for station in self.stations:
+            station_name = station.station_name
+            station_codes = self._station_codes_by_station_name[station_name]
+            if len(station_codes) < 2:
+                continue  # Not an interchange.
+            if station_name not in Transfers.interchange_transfers:
                 raise ValueError(
                     f"No transfer durations available for station {station_name}."
                 )
-        pairs.sort(
-            key=lambda station_codes: (
-                SingaporeStation.to_station_code_components(station_codes[0]),
-                SingaporeStation.to_station_code_components(station_codes[1]),
-            )
-        )
-        for start, end, station_name in pairs:
             # As a simplification, treat transfer time in both directions as equal.
             # TODO: Update in the future when more direction-specific transfer time is available.
             duration = Transfers.interchange_transfers[station_name]
-            adjacency_matrix[start][end] = {"duration": duration}
+            for station_code in station_codes:
+                if station_code != station.station_code:
+                    adjacency_matrix.setdefault(station.station_code, {})[
+                        station_code
+                    ] = {"duration": duration}
 
         return adjacency_matrix
 
@@ -312,8 +300,8 @@ class Config:
 
         # Filter out unused conditional transfers.
         edge_types: set[str] = set()
-        for start in self.segment_adjacency_matrix:
-            for _, segment_details in self.segment_adjacency_matrix[start].items():
+        for end_station_codes in self.segment_adjacency_matrix.values():
+            for segment_details in end_station_codes.values():
                 edge_type = segment_details.get("edge_type", None)
                 if isinstance(edge_type, str):
                     edge_types.add(edge_type)
@@ -357,15 +345,10 @@ class Config:
             and "EW15" in self.station_code_to_station
             and "NS26" in self.station_code_to_station
         ):  # Special case: EWL still part of NSL.
+            # Per-line station lists are already sorted, so terminals are at either end.
             terminals = {
-                sorted(
-                    self._stations_by_line_code["EW"],
-                    key=SingaporeStation.sort_key,
-                )[-1].station_code,
-                sorted(
-                    self._stations_by_line_code["NS"],
-                    key=SingaporeStation.sort_key,
-                )[0].station_code,
+                self._stations_by_line_code["EW"][-1].station_code,
+                self._stations_by_line_code["NS"][0].station_code,
             }  # Highest EW and Lowest NS
             non_linear_line_terminals["EW"] = terminals.copy()
             non_linear_line_terminals["NS"] = terminals.copy()
@@ -374,14 +357,8 @@ class Config:
             "DE1" in self.station_code_to_station
         ):  # Special case: Downtown Line 2 Extension.
             terminals = {
-                sorted(
-                    self._stations_by_line_code["DE"],
-                    key=SingaporeStation.sort_key,
-                )[-1].station_code,
-                sorted(
-                    self._stations_by_line_code["DT"],
-                    key=SingaporeStation.sort_key,
-                )[-1].station_code,
+                self._stations_by_line_code["DE"][-1].station_code,
+                self._stations_by_line_code["DT"][-1].station_code,
             }  # Highest DE and Highest DT
             non_linear_line_terminals["DE"] = terminals.copy()
             non_linear_line_terminals["DT"] = terminals.copy()
@@ -404,9 +381,8 @@ class Config:
                 pseudo_station_code
             ]
             for pseudo_station_code in sorted(
-                set(SingaporeStation.pseudo_station_codes).intersection(
-                    self.station_code_to_station
-                ),
+                SingaporeStation.pseudo_station_codes.keys()
+                & self.station_code_to_station.keys(),
                 key=SingaporeStation.to_station_code_components,
             )
         }
@@ -422,9 +398,36 @@ class Config:
             tomlkit.items.InlineTable: tomlkit InlineTable with dictionary content.
         """
         it = tomlkit.inline_table()
-        it.update(d)
+        # Append directly; `it.update(d)` goes through the generic `__setitem__` for every key.
+        for key, value in d.items():
+            it.append(key, value)
         return it
 
+    @classmethod
+    def __shallow_dict_to_table(cls, d: dict) -> tomlkit.items.Table:
+        """Convert shallow dictionary to tomlkit Table.
+
+        tomlkit scans the whole table for sub-tables on every append, which is quadratic for large tables.
+        As `d` has no sub-tables, the scan is skipped by flagging the table as being parsed while appending.
+
+        Args:
+            d (dict): Shallow dictionary (values must not be dictionaries, but may be inline tables).
+
+        Returns:
+            tomlkit.items.Table: tomlkit Table with dictionary content.
+        """
+        table = tomlkit.table()
+        # Relies on tomlkit's undocumented parse mode, which also skips the whitespace/trivia fix-ups
+        # that `append` normally does. tomlkit is pinned below 0.14 in pyproject.toml for this reason;
+        # rendering is covered by test_make_network* in tests/test_config.py.
+        table.value.parsing(True)
+        try:
+            for key, value in d.items():
+                table.append(key, value)
+        finally:
+            table.value.parsing(False)
+        return table
+
     def make_network(self) -> tomlkit.TOMLDocument:
         """Make network config.
 
@@ -434,37 +437,39 @@ class Config:
         network: tomlkit.TOMLDocument = tomlkit.TOMLDocument()
 
         network["schema"] = 1
-        network["stations"] = {
-            station.station_code: station.station_name for station in self.stations
-        }
-        network["segments"] = {
-            f"{first_station_code}-{second_station_code}": Config.__shallow_dict_to_inline_table(
-                self.segment_adjacency_matrix[first_station_code][second_station_code]
-            )
-            for first_station_code in self.segment_adjacency_matrix
-            for second_station_code in self.segment_adjacency_matrix[first_station_code]
-        }
-        network["transfers"] = {
-            f"{first_station_code}-{second_station_code}": Config.__shallow_dict_to_inline_table(
-                self.transfer_adjacency_matrix[first_station_code][second_station_code]
-            )
-            for first_station_code in self.transfer_adjacency_matrix
-            for second_station_code in self.transfer_adjacency_matrix[
-                first_station_code
-            ]
-        }
+        network["stations"] = Config.__shallow_dict_to_table(
+            {station.station_code: station.station_name for station in self.stations}
+        )
+        network["segments"] = Config.__shallow_dict_to_table(
+            {
+                f"{first_station_code}-{second_station_code}": Config.__shallow_dict_to_inline_table(
+                    segment_details
+                )
+                for first_station_code, segments in self.segment_adjacency_matrix.items()
+                for second_station_code, segment_details in segments.items()
+            }
+        )
+        network["transfers"] = Config.__shallow_dict_to_table(
+            {
+                f"{first_station_code}-{second_station_code}": Config.__shallow_dict_to_inline_table(
+                    transfer_details
+                )
+                for first_station_code, transfers in self.transfer_adjacency_matrix.items()
+                for second_station_code, transfer_details in transfers.items()
+            }
+        )
         network["conditional_transfers"] = {
-            tomlkit.key(
-                [first_edge_type, second_edge_type]
-            ): self.conditional_transfers[first_edge_type][second_edge_type]
-            for first_edge_type in self.conditional_transfers
-            for second_edge_type in self.conditional_transfers[first_edge_type]
+            tomlkit.key([first_edge_type, second_edge_type]): duration
+            for first_edge_type, durations in self.conditional_transfers.items()
+            for second_edge_type, duration in durations.items()
         }
         network["non_linear_line_terminals"] = {
             tomlkit.key([line_code, station_code]): 1
-            for line_code in sorted(self.non_linear_line_terminals)
+            for line_code, station_codes in sorted(
+                self.non_linear_line_terminals.items()
+            )
             for station_code in sorted(
-                self.non_linear_line_terminals[line_code],
+                station_codes,
                 key=SingaporeStation.to_station_code_components,
             )
         }
@@ -490,6 +495,8 @@ class Config:
         Returns:
             str: diff delta output as a single TOML document string.
         """
+        if original == updated:  # Nothing to mark; skip the diff.
+            return "\n".join(updated)
         delta = list(
             difflib.Differ().compare(original, updated)
         )  # diff against line without inline-comment, if any.
@@ -533,13 +540,12 @@ class Config:
                 original = f.read().splitlines()
         except OSError:
             original = None
-        network = self.make_network()
-        updated: list[str] = tomlkit.dumps(network).splitlines()
+        network: str = tomlkit.dumps(self.make_network())
         with open(path, "w") as f:
             if original is None or all(not line for line in original):
-                tomlkit.dump(network, f)  # File at path is empty or non-existent.
+                f.write(network)  # File at path is empty or non-existent.
             else:
-                f.write(Config.compare_toml(original, updated))
+                f.write(Config.compare_toml(original, network.splitlines()))
 
     @classmethod
     def parse_network_config(
@@ -573,14 +579,14 @@ class Config:
 
         segments_ = dict()
         for segment_link, segment_details in segments.items():
-            vertices = tuple(segment_link.split("-", 2))
-            if len(vertices) != 2:
+            start, separator, end = segment_link.partition("-")
+            if not separator or "-" in end:
                 raise ValueError(
                     f"Invalid config file: Segment link must be in format 'AB1-AB2'. Got {segment_link}."
                 )
             if not isinstance(segment_details, dict):
                 raise ValueError("Invalid config file: Segment details must be a dict.")
-            segments_[vertices] = segment_details
+            segments_[(start, end)] = segment_details
 
         transfers = network.get("transfers", None)
         if not isinstance(transfers, dict):
@@ -590,8 +596,8 @@ class Config:
 
         transfers_ = dict()
         for transfer, transfer_details in transfers.items():
-            vertices = tuple(transfer.split("-", 2))
-            if len(vertices) != 2:
+            start, separator, end = transfer.partition("-")
+            if not separator or "-" in end:
                 raise ValueError(
                     f"Invalid config file: Transfer must be in format 'AB1-AB2'. Got {transfer}."
                 )
@@ -599,7 +605,7 @@ class Config:
                 raise ValueError(
                     "Invalid config file: Transfer details must be a dict."
                 )
-            transfers_[vertices] = transfer_details
+            transfers_[(start, end)] = transfer_details
 
         conditional_transfers = network.get("conditional_transfers", None)
         if not isinstance(conditional_transfers, dict):
@@ -14,7 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-import collections
 import datetime
 
 import immutabledict
@@ -700,8 +699,10 @@ class StageMeta(type):
     )
 
     def __new__(cls, name, bases, dct):
-        stations: set[SingaporeStation] = set()
-        if not set(cls.__stages_defunct).issubset(cls.__stages):
+        # Station code -> station. Station codes are unique among operational stations at any stage.
+        stations: dict[str, SingaporeStation] = dict()
+        stations_by_stage: dict[str, frozenset[SingaporeStation]] = dict()
+        if not cls.__stages_defunct.keys() <= cls.__stages.keys():
             raise AttributeError(
                 "__stages must contain all stages in __stages_defunct."
             )  # pragma: no cover
@@ -713,46 +714,41 @@ class StageMeta(type):
                     f"Duplicate stage description not allowed: {stage_description}"
                 )  # pragma: no cover
             stages_descriptions.add(stage_description)
-            stage_stations_set = set(stage_stations)
-            stage_defunct_stations_set = set(cls.__stages_defunct.get(stage, ()))
+            stage_defunct_stations = cls.__stages_defunct.get(stage, ())
 
-            stations_added_and_removed_at_same_stage = stage_stations_set.intersection(
-                stage_defunct_stations_set
-            )
-            if stations_added_and_removed_at_same_stage:
+            if not frozenset(stage_stations).isdisjoint(stage_defunct_stations):
                 raise AttributeError(
-                    f"Never add and remove the same station at the same stage: {stations_added_and_removed_at_same_stage}"
+                    f"Never add and remove the same station at the same stage: {set(stage_stations).intersection(stage_defunct_stations)}"
                 )  # pragma: no cover
-            existing_stations_added_again = stage_stations_set.intersection(stations)
-            if existing_stations_added_again:
-                raise AttributeError(
-                    f"Do not attempt to re-add existing stations: {existing_stations_added_again}"
-                )  # pragma: no cover
-            non_existent_stations_to_be_removed = stage_defunct_stations_set.difference(
-                stations
-            )
-            if non_existent_stations_to_be_removed:
-                raise AttributeError(
-                    f"Do not attempt to remove non-existing stations: {non_existent_stations_to_be_removed}"
-                )  # pragma: no cover
-
-            stations.update(stage_stations_set)
-            stations.difference_update(stage_defunct_stations_set)
 
-            # Ensure no station code has multiple names.
-            station_code_counts = collections.Counter(
-                station.station_code for station in stations
-            )
-            for station_code, count in station_code_counts.items():
-                if count > 1:
+            # Remove stations first, so that a station code freed up at this stage may be reused at this stage.
+            for station in stage_defunct_stations:
+                if stations.get(station.station_code, None) != station:
                     raise AttributeError(
-                        f"Not allowed: Multiple stations with station code {station_code} must not exist concurrently."
+                        f"Do not attempt to remove non-existing stations: {station}"
                     )  # pragma: no cover
+                del stations[station.station_code]
+            for station in stage_stations:
+                existing_station = stations.get(station.station_code, None)
+                if existing_station == station:
+                    raise AttributeError(
+                        f"Do not attempt to re-add existing stations: {station}"
+                    )  # pragma: no cover
+                if existing_station is not None:
+                    raise AttributeError(
+                        f"Not allowed: Multiple stations with station code {station.station_code} must not exist concurrently."
+                    )  # pragma: no cover
+                stations[station.station_code] = station
+
+            stations_by_stage[stage] = frozenset(stations.values())
 
         cls.stages = immutabledict.immutabledict(
             {stage: stations for stage, (stations, _, _) in cls.__stages.items()}
         )
         cls.stages_defunct = cls.__stages_defunct
+        cls.stations_by_stage = immutabledict.immutabledict(
+            stations_by_stage
+        )  # Operational stations as of each stage.
         cls.stages_info = {
             stage: (stage_description, stage_timestamp)
             for stage, (_, stage_description, stage_timestamp) in cls.__stages.items()
@@ -761,6 +757,8 @@ class StageMeta(type):
 
 
 class Stage(metaclass=StageMeta):
+    __slots__ = ("stations",)
+
     def __init__(self, stage: str):
         """Setup `Stage` with stations operational as of given `stage`.
 
@@ -772,16 +770,4 @@ class Stage(metaclass=StageMeta):
         """
         if stage not in Stage.stages:
             raise ValueError(f"No such stage: {stage}")
-        self.stations: set[SingaporeStation] = set()
-        for (
-            current_stage,
-            current_stage_stations,
-        ) in (
-            Stage.stages.items()
-        ):  # Add/Remove stations from all stages up to and including `stage`.
-            self.stations.update(current_stage_stations)
-            self.stations.difference_update(
-                Stage.stages_defunct.get(current_stage, set())
-            )
-            if current_stage == stage:
-                break
+        self.stations: set[SingaporeStation] = set(Stage.stations_by_stage[stage])
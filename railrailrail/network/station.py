@@ -18,7 +18,9 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import functools
 import re
+import sys
 from collections import defaultdict
 
 import immutabledict
@@ -101,10 +103,16 @@ class SingaporeStation(Station):
     )
 
     def __post_init__(self):
+        # Station codes and names are used heavily as dict keys; interning lets lookups compare by identity.
+        # Only identifier-like literals are interned automatically, so names with spaces and strings built at
+        # runtime are not. The preset tables (train segments, transfers, walks) intern theirs to match.
+        object.__setattr__(self, "station_code", sys.intern(self.station_code))
+        object.__setattr__(self, "station_name", sys.intern(self.station_name))
+
         line_code, station_number, station_number_suffix = (
             self.to_station_code_components(self.station_code)
         )  # Based on pseudo station code, if any.
-        object.__setattr__(self, "line_code", line_code)
+        object.__setattr__(self, "line_code", sys.intern(line_code))
         object.__setattr__(self, "station_number", int(station_number))
         object.__setattr__(self, "station_number_suffix", station_number_suffix)
 
@@ -120,6 +128,7 @@ class SingaporeStation(Station):
         )
 
     @classmethod
+    @functools.cache
     def to_station_code_components(cls, station_code: str) -> tuple[str, int, str]:
         """Split station code into its components; line code, station number, and station number
         suffix.
@@ -128,6 +137,8 @@ class SingaporeStation(Station):
 
         Supports station codes with alphabetical suffixes like NS3 -> NS3A -> NS4.
 
+        Results are memoized, as the same station codes are parsed repeatedly when sorting.
+
         Args:
             station_code (str): Station code to be split up.
 
@@ -138,9 +149,12 @@ class SingaporeStation(Station):
             tuple[str, int, str]: Separated station components.
             For example ("NS", 3, "A") or ("NS", 4, "").
         """
-        # Check for 2-alphabet or 3-alphabet
-        if len(station_code) in (2, 3) and all(
-            ("A" <= letter <= "Z") for letter in station_code
+        # Check for 2-alphabet or 3-alphabet. The str predicates run in C; together they only accept A-Z.
+        if (
+            len(station_code) in (2, 3)
+            and station_code.isascii()
+            and station_code.isalpha()
+            and station_code.isupper()
         ):
             return station_code, -1, ""
 
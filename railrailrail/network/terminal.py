@@ -14,8 +14,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from collections import OrderedDict, defaultdict
-
 import immutabledict
 from dijkstar import Graph
 
@@ -50,14 +48,14 @@ class Terminal:
     def get_terminals(
         cls,
         non_linear_line_terminals: dict[str, dict[str, int]],
-        adjacency_matrix: defaultdict[str, OrderedDict[str, dict]],
+        adjacency_matrix: dict[str, dict[str, dict]],
     ) -> set[str]:
         """Identify terminal stations from a uni-directional adjacency matrix by counting their neighbours.
         Stations with purely alphabetic station codes will be identified as terminals.
 
         Args:
             non_linear_line_terminals (dict[str, dict[str, int]]): Map of non-linear line codes to terminal station codes.
-            adjacency_matrix (defaultdict[str, OrderedDict[str, dict]]): Uni-directional adjacency matrix
+            adjacency_matrix (dict[str, dict[str, dict]]): Uni-directional adjacency matrix
             of station codes linked in ascending order.
 
         Returns:
@@ -65,14 +63,19 @@ class Terminal:
         """
         terminals: set[str] = set()
 
-        bi_directional_adjacency_matrix = defaultdict(dict)
-        for station_code in adjacency_matrix:
-            for next_station_code in adjacency_matrix[station_code]:
-                bi_directional_adjacency_matrix[station_code][next_station_code] = None
-                bi_directional_adjacency_matrix[next_station_code][station_code] = None
+        bi_directional_adjacency_matrix: dict[str, set[str]] = dict()
+        for station_code, next_station_codes in adjacency_matrix.items():
+            bi_directional_adjacency_matrix.setdefault(station_code, set()).update(
+                next_station_codes
+            )
+            for next_station_code in next_station_codes:
+                bi_directional_adjacency_matrix.setdefault(
+                    next_station_code, set()
+                ).add(station_code)
 
+        to_station_code_components = SingaporeStation.to_station_code_components
         for station_code, neighbours in bi_directional_adjacency_matrix.items():
-            line_code, _, _ = SingaporeStation.to_station_code_components(station_code)
+            line_code, _, _ = to_station_code_components(station_code)
             if line_code in non_linear_line_terminals:
                 if station_code in non_linear_line_terminals[line_code]:
                     terminals.add(station_code)
@@ -130,25 +133,28 @@ class Terminal:
             )
         is_ascending: bool = start_station_code_components < end_station_code_components
         # From start_station_code, traverse nodes in ascending or descending order with same line code until dead end is reached.
+        # Bind hot lookups locally for the loop below.
+        to_station_code_components = SingaporeStation.to_station_code_components
+        get_incoming = graph.get_incoming
         next_station_code = start_station_code
+        next_station_code_components = start_station_code_components
         while True:
-            station_and_neighbours = sorted(
-                [
-                    *(
-                        station_code
-                        for station_code in graph.get_incoming(next_station_code)
-                        if SingaporeStation.to_station_code_components(station_code)[0]
-                        == start_line_code
-                    ),
-                    next_station_code,
-                ],
-                key=SingaporeStation.to_station_code_components,
-            )
-            next_station_index = station_and_neighbours.index(next_station_code) + (
-                1 if is_ascending else -1
-            )
-            if next_station_index < 0 or next_station_index >= len(
-                station_and_neighbours
-            ):
+            # Pick the nearest same-line neighbour in the direction of travel, without sorting all neighbours.
+            nearest: tuple[tuple[str, int, str], str] | None = None
+            for station_code in get_incoming(next_station_code):
+                station_code_components = to_station_code_components(station_code)
+                if station_code_components[0] != start_line_code:
+                    continue
+                candidate = (station_code_components, station_code)
+                if is_ascending:
+                    if station_code_components > next_station_code_components and (
+                        nearest is None or candidate < nearest
+                    ):
+                        nearest = candidate
+                elif station_code_components < next_station_code_components and (
+                    nearest is None or candidate > nearest
+                ):
+                    nearest = candidate
+            if nearest is None:
                 return next_station_code
-            next_station_code = station_and_neighbours[next_station_index]
+            next_station_code_components, next_station_code = nearest
@@ -14,6 +14,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import sys
+
+import immutabledict
+
 
 class TransfersMeta(type):
     """Duration presets for transfers, which includes defunct and future interchanges.
@@ -30,69 +34,66 @@ class TransfersMeta(type):
     - underground/elevated -> 12 min
     """
 
-    __interchange_transfers: tuple[tuple[str, int]] = (
-        ("Ang Mo Kio", 600),
-        ("Bayfront", 360),
-        ("Bishan", 480),
-        ("Boon Lay", 600),
-        ("Botanic Gardens", 480),
-        ("Bright Hill", 540),
-        ("Bugis", 540),
-        ("Bukit Panjang", 600),
-        ("Buona Vista", 480),
-        ("Caldecott", 540),
-        ("Changi Airport Terminal 5", 540),
-        ("Chinatown", 420),
-        ("Choa Chu Kang", 420),
-        ("City Hall", 360),
-        ("Clementi", 480),
-        ("Dhoby Ghaut", 480),
-        ("Expo", 480),
-        ("HarbourFront", 420),
-        ("Hougang", 540),
-        ("Jurong East", 420),
-        ("King Albert Park", 540),
-        ("Little India", 480),
-        ("MacPherson", 360),
-        ("Marina Bay", 600),
-        ("Newton", 540),
-        ("Nicoll Highway", 360),  # Interchange for ccl_e
-        ("Orchard", 480),
-        ("Outram Park", 480),
-        ("Pasir Ris", 480),
-        ("Paya Lebar", 480),
-        ("Promenade", 420),
-        ("Punggol", 420),
-        ("Raffles Place", 360),
-        ("Riviera", 480),
-        ("Sengkang", 420),
-        ("Serangoon", 480),
-        ("Stadium", 360),  # Interchange for ccl_e
-        ("Stevens", 420),
-        ("Sungei Bedok", 540),
-        ("Sungei Kadut", 480),
-        ("Tampines", 720),
-        ("Tanah Merah", 420),
-        ("Tengah", 360),
-        ("Woodlands", 540),
-    )
+    __interchange_transfers: dict[str, int] = {
+        "Ang Mo Kio": 600,
+        "Bayfront": 360,
+        "Bishan": 480,
+        "Boon Lay": 600,
+        "Botanic Gardens": 480,
+        "Bright Hill": 540,
+        "Bugis": 540,
+        "Bukit Panjang": 600,
+        "Buona Vista": 480,
+        "Caldecott": 540,
+        "Changi Airport Terminal 5": 540,
+        "Chinatown": 420,
+        "Choa Chu Kang": 420,
+        "City Hall": 360,
+        "Clementi": 480,
+        "Dhoby Ghaut": 480,
+        "Expo": 480,
+        "HarbourFront": 420,
+        "Hougang": 540,
+        "Jurong East": 420,
+        "King Albert Park": 540,
+        "Little India": 480,
+        "MacPherson": 360,
+        "Marina Bay": 600,
+        "Newton": 540,
+        "Nicoll Highway": 360,  # Interchange for ccl_e
+        "Orchard": 480,
+        "Outram Park": 480,
+        "Pasir Ris": 480,
+        "Paya Lebar": 480,
+        "Promenade": 420,
+        "Punggol": 420,
+        "Raffles Place": 360,
+        "Riviera": 480,
+        "Sengkang": 420,
+        "Serangoon": 480,
+        "Stadium": 360,  # Interchange for ccl_e
+        "Stevens": 420,
+        "Sungei Bedok": 540,
+        "Sungei Kadut": 480,
+        "Tampines": 720,
+        "Tanah Merah": 420,
+        "Tengah": 360,
+        "Woodlands": 540,
+    }  # Duplicate station names are flagged by ruff (F601: repeated dict key literal).
 
     def __new__(cls, name, bases, dct):
-        cls.interchange_transfers = {
-            station_name: duration
-            for station_name, duration in cls.__interchange_transfers
+        interchange_transfers = {
+            sys.intern(station_name): duration
+            for station_name, duration in cls.__interchange_transfers.items()
         }
-        if len(cls.interchange_transfers) != len(cls.__interchange_transfers):
-            raise AttributeError(
-                "Duplicate station names are not allowed."
-            )  # pragma: no cover
-        if any(duration <= 0 for duration in cls.interchange_transfers.values()):
+        if any(duration <= 0 for duration in interchange_transfers.values()):
             raise AttributeError(
                 "Transfer duration must be positive."
             )  # pragma: no cover
+        cls.interchange_transfers = immutabledict.immutabledict(interchange_transfers)
 
         return super().__new__(cls, name, bases, dct)
 
 
 class Transfers(metaclass=TransfersMeta):
-    pass
+    __slots__ = ()
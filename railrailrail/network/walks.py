@@ -14,11 +14,18 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import sys
+
+import immutabledict
+
 
 class WalksMeta(type):
     """Walking routes and their estimated durations between some stations.
 
     From [LTA Walking Train Map (WTM)](https://www.lta.gov.sg/content/dam/ltagov/who_we_are/statistics_and_publications/pdf/connect_nov_2018_fa_12nov.pdf)
+
+    `route_durations` maps each unordered pair of station names to its walking duration,
+    e.g. frozenset({"Bras Basah", "Bencoolen"}) -> 120.
     """
 
     __routes: tuple[tuple[str, str, int]] = (
@@ -49,7 +56,8 @@ class WalksMeta(type):
     )
 
     def __new__(cls, name, bases, dct):
-        pairs: set[tuple[str, str]] = set()
+        routes: list[tuple[str, str, int]] = []
+        route_durations: dict[frozenset[str], int] = dict()
         for station_name_1, station_name_2, duration in cls.__routes:
             if (
                 station_name_1 == station_name_2
@@ -61,15 +69,19 @@ class WalksMeta(type):
                 raise AttributeError(
                     f"Route must be between 2 different names with a positive duration. Got {station_name_1}, {station_name_2}, {duration}"
                 )  # pragma: no cover
-            pair = tuple(sorted([station_name_1, station_name_2]))
-            if pair in pairs:
+            station_name_1 = sys.intern(station_name_1)
+            station_name_2 = sys.intern(station_name_2)
+            pair = frozenset((station_name_1, station_name_2))
+            if pair in route_durations:
                 raise AttributeError(
                     f"Duplicate route not allowed: {station_name_1}, {station_name_2}"
                 )  # pragma: no cover
-            pairs.add(pair)
-        cls.routes = cls.__routes
+            route_durations[pair] = duration
+            routes.append((station_name_1, station_name_2, duration))
+        cls.routes = tuple(routes)
+        cls.route_durations = immutabledict.immutabledict(route_durations)
         return super().__new__(cls, name, bases, dct)
 
 
 class Walks(metaclass=WalksMeta):
-    pass
+    __slots__ = ()
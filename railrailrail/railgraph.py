@@ -210,6 +210,8 @@ class RailGraph:
         return cls(*Config.parse_network_config(network_path, coordinates_path))
 
     def _cost_func(self, start: str, end: str) -> typing.Callable[..., int]:
+        conditional_transfers = self.conditional_transfers
+
         def cost_func_aux(
             current_station: str,
             next_station: str,
@@ -269,9 +271,12 @@ class RailGraph:
             ):  # Walking away from station -> Not waiting for train to depart.
                 dwell_time = 0
 
-            cost += self.conditional_transfers.get(previous_edge_type, dict()).get(
-                next_edge_type, 0
+            # Avoid allocating an empty dict on every call for edge types without conditional transfers.
+            conditional_transfer_durations = conditional_transfers.get(
+                previous_edge_type, None
             )
+            if conditional_transfer_durations is not None:
+                cost += conditional_transfer_durations.get(next_edge_type, 0)
 
             if current_station == start or next_station == end:
                 if (
@@ -340,10 +345,9 @@ class RailGraph:
             f"Start at {self.station_code_to_station[pathinfo.nodes[0]].full_station_name}"
         ]
         for edge_idx, (
-            current_station_code,
-            next_station_code,
+            (current_station_code, next_station_code),
             edge_details,
-        ) in enumerate(zip(pathinfo.nodes[:-1], pathinfo.nodes[1:], pathinfo.edges)):
+        ) in enumerate(zip(itertools.pairwise(pathinfo.nodes), pathinfo.edges)):
             current_station = self.station_code_to_station[current_station_code]
             next_station = self.station_code_to_station[next_station_code]
             is_pseudo_transfer = (
@@ -355,6 +359,15 @@ class RailGraph:
             )
             current_station_full_name = current_station.full_station_name
             next_station_full_name = next_station.full_station_name
+            conditional_transfer_durations = (
+                self.conditional_transfers.get(pathinfo.edges[edge_idx - 1][1], None)
+                if 0 < edge_idx
+                else None
+            )
+            is_conditional_transfer = (
+                conditional_transfer_durations is not None
+                and edge_details[1] in conditional_transfer_durations
+            )
 
             def get_terminal_full_station_name() -> str | None:
                 terminal_station: SingaporeStation | None = (
@@ -402,13 +415,7 @@ class RailGraph:
                 elif edge_details[2] == "walk":  # Walk to the next station.
                     steps.append(f"Walk to {next_station_full_name}")
                     status = "walking"
-                elif (
-                    0 < edge_idx
-                    and self.conditional_transfers.get(
-                        pathinfo.edges[edge_idx - 1][1], dict()
-                    ).get(pathinfo.edges[edge_idx][1], None)
-                    is not None
-                ):  # Conditional interchange transfer
+                elif is_conditional_transfer:  # Conditional interchange transfer
                     raise RuntimeError(
                         "Something is not right; conditional interchange transfers should not be interchange transfers. "
                         "Check ConditionalInterchange class and rail network structure. PathInfo: %s"
@@ -438,13 +445,7 @@ class RailGraph:
                     steps.append(f"Alight at {current_station_full_name}")
                     steps.append(f"Walk to {next_station_full_name}")
                     status = "walking"
-                elif (
-                    0 < edge_idx
-                    and self.conditional_transfers.get(
-                        pathinfo.edges[edge_idx - 1][1], dict()
-                    ).get(pathinfo.edges[edge_idx][1], None)
-                    is not None
-                ):  # Conditional interchange transfer
+                elif is_conditional_transfer:  # Conditional interchange transfer
                     steps.append(f"Switch over at {current_station_full_name}")
                     terminal_full_station_name: str | None = (
                         get_terminal_full_station_name()
@@ -497,7 +498,7 @@ class RailGraph:
                 self.station_coordinates[current_node],
                 self.station_coordinates[next_node],
             )
-            for current_node, next_node in zip(nodes[:-1], nodes[1:])
+            for current_node, next_node in itertools.pairwise(nodes)
         )
 
         logger.info(
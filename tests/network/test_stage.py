@@ -23,6 +23,16 @@ class TestStage:
     def test_stages(self):
         assert Stage.stages
         assert Stage.stages_defunct
+        assert Stage.stations_by_stage.keys() == Stage.stages.keys()
+
+    def test_stage_stations(self):
+        assert {station.station_code for station in Stage("phase_1_1").stations} == {
+            "NS15",
+            "NS16",
+            "NS17",
+            "NS18",
+            "NS19",
+        }
 
     def test_bad_stage(self):
         with pytest.raises(ValueError):
@@ -34,6 +34,9 @@ class TestStation:
             (("A"), None),
             (("A1"), None),
             (("A1A"), None),
+            (("Cg"), None),
+            (("stc"), None),
+            (("ns1"), None),
             (("XYZ0"), None),
             (("XYZ1"), None),
             (("XYZ1A"), None),
@@ -20,3 +20,4 @@ from railrailrail.network.walks import Walks
 class TestWalks:
     def test_routes(self):
         assert Walks.routes
+        assert len(Walks.route_durations) == len(Walks.routes)
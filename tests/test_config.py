@@ -16,7 +16,6 @@ limitations under the License.
 
 import json
 import pathlib
-from collections import OrderedDict, defaultdict
 
 import pytest
 import tomlkit
@@ -51,153 +50,123 @@ class TestConfig:
         )
 
     def test_segment_adjacency_matrix(self):
-        expected_phase_1_2_segment_adjacency_matrix = defaultdict(
-            OrderedDict[str, dict],
-            {
-                "EW15": OrderedDict(
-                    {
-                        "EW16": {
-                            "duration_asc": 85,
-                            "duration_desc": 85,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 60,
-                        },
-                        "NS26": {
-                            "duration_asc": 105,
-                            "duration_desc": 105,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        },
-                    }
-                ),
-                "NS15": OrderedDict(
-                    {
-                        "NS16": {
-                            "duration_asc": 115,
-                            "duration_desc": 115,
-                            "dwell_time_asc": 60,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS16": OrderedDict(
-                    {
-                        "NS17": {
-                            "duration_asc": 160,
-                            "duration_desc": 160,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS17": OrderedDict(
-                    {
-                        "NS18": {
-                            "duration_asc": 95,
-                            "duration_desc": 95,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS18": OrderedDict(
-                    {
-                        "NS19": {
-                            "duration_asc": 95,
-                            "duration_desc": 95,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS19": OrderedDict(
-                    {
-                        "NS20": {
-                            "duration_asc": 110,
-                            "duration_desc": 110,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS20": OrderedDict(
-                    {
-                        "NS21": {
-                            "duration_asc": 100,
-                            "duration_desc": 100,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS21": OrderedDict(
-                    {
-                        "NS22": {
-                            "duration_asc": 110,
-                            "duration_desc": 110,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS22": OrderedDict(
-                    {
-                        "NS23": {
-                            "duration_asc": 100,
-                            "duration_desc": 100,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS23": OrderedDict(
-                    {
-                        "NS24": {
-                            "duration_asc": 75,
-                            "duration_desc": 75,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS24": OrderedDict(
-                    {
-                        "NS25": {
-                            "duration_asc": 85,
-                            "duration_desc": 85,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
-                "NS25": OrderedDict(
-                    {
-                        "NS26": {
-                            "duration_asc": 100,
-                            "duration_desc": 100,
-                            "dwell_time_asc": 28,
-                            "dwell_time_desc": 28,
-                        }
-                    }
-                ),
+        expected_phase_1_2_segment_adjacency_matrix = {
+            "EW15": {
+                "EW16": {
+                    "duration_asc": 85,
+                    "duration_desc": 85,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 60,
+                },
+                "NS26": {
+                    "duration_asc": 105,
+                    "duration_desc": 105,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                },
             },
-        )
+            "NS15": {
+                "NS16": {
+                    "duration_asc": 115,
+                    "duration_desc": 115,
+                    "dwell_time_asc": 60,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS16": {
+                "NS17": {
+                    "duration_asc": 160,
+                    "duration_desc": 160,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS17": {
+                "NS18": {
+                    "duration_asc": 95,
+                    "duration_desc": 95,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS18": {
+                "NS19": {
+                    "duration_asc": 95,
+                    "duration_desc": 95,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS19": {
+                "NS20": {
+                    "duration_asc": 110,
+                    "duration_desc": 110,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS20": {
+                "NS21": {
+                    "duration_asc": 100,
+                    "duration_desc": 100,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS21": {
+                "NS22": {
+                    "duration_asc": 110,
+                    "duration_desc": 110,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS22": {
+                "NS23": {
+                    "duration_asc": 100,
+                    "duration_desc": 100,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS23": {
+                "NS24": {
+                    "duration_asc": 75,
+                    "duration_desc": 75,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS24": {
+                "NS25": {
+                    "duration_asc": 85,
+                    "duration_desc": 85,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+            "NS25": {
+                "NS26": {
+                    "duration_asc": 100,
+                    "duration_desc": 100,
+                    "dwell_time_asc": 28,
+                    "dwell_time_desc": 28,
+                }
+            },
+        }
         assert json.dumps(self.config_phase_1_2.segment_adjacency_matrix) == json.dumps(
             expected_phase_1_2_segment_adjacency_matrix
         )
 
     def test_transfer_adjacency_matrix(self):
-        expected_phase_2b_3_transfer_adjacency_matrix = defaultdict(
-            OrderedDict[str, dict],
-            {
-                "EW13": OrderedDict({"NS25": {"duration": 360}}),
-                "EW14": OrderedDict({"NS26": {"duration": 360}}),
-                "EW24": OrderedDict({"NS1": {"duration": 420}}),
-                "NS1": OrderedDict({"EW24": {"duration": 420}}),
-                "NS25": OrderedDict({"EW13": {"duration": 360}}),
-                "NS26": OrderedDict({"EW14": {"duration": 360}}),
-            },
-        )
+        expected_phase_2b_3_transfer_adjacency_matrix = {
+            "EW13": {"NS25": {"duration": 360}},
+            "EW14": {"NS26": {"duration": 360}},
+            "EW24": {"NS1": {"duration": 420}},
+            "NS1": {"EW24": {"duration": 420}},
+            "NS25": {"EW13": {"duration": 360}},
+            "NS26": {"EW14": {"duration": 360}},
+        }
         assert json.dumps(
             self.config_phase_2b_3.transfer_adjacency_matrix
         ) == json.dumps(expected_phase_2b_3_transfer_adjacency_matrix)
@@ -206,6 +175,22 @@ class TestConfig:
         network = self.config_phase_1_1.make_network()
         assert tomlkit.dumps(network) == self.config_phase_1_1_toml_str
 
+    def test_make_network_transfers(self):
+        network_toml_str = tomlkit.dumps(self.config_phase_2b_3.make_network())
+        start = network_toml_str.index("\n\n[segments]\n")
+        end = network_toml_str.index("\n\n[transfers]\n")
+        assert network_toml_str[start:end].strip().count("\n") == sum(
+            len(segments)
+            for segments in self.config_phase_2b_3.segment_adjacency_matrix.values()
+        )  # One line per segment, after the [segments] header.
+        assert network_toml_str[end:] == (
+            "\n\n[transfers]\n"
+            "EW13-NS25 = {duration = 360}\nEW14-NS26 = {duration = 360}\n"
+            "EW24-NS1 = {duration = 420}\nNS1-EW24 = {duration = 420}\n"
+            "NS25-EW13 = {duration = 360}\nNS26-EW14 = {duration = 360}\n\n"
+            "[conditional_transfers]\n\n[non_linear_line_terminals]\n\n[station_code_pseudonyms]\n"
+        )
+
     def test_compare_toml(self):
         original = self.config_phase_1_1_toml_str.split("\n")
         modified = original.copy()
@@ -229,6 +214,10 @@ class TestConfig:
             "[conditional_transfers]\n\n\n# [non_linear_line_terminals]\n[linear_line_terminals] # MODIFIED\n\n[station_code_pseudonyms]"
         )
 
+    def test_compare_toml_unchanged(self):
+        original = self.config_phase_1_1_toml_str.split("\n")
+        assert Config.compare_toml(original, original.copy()) == "\n".join(original)
+
     def test_update_network_config_file(self):
         config_file_path = pathlib.Path("network_test.toml")
 
@@ -238,9 +227,13 @@ class TestConfig:
         self.config_tel_3.update_network_config_file(config_file_path)
         assert mocked_open.call_count == 2
 
+        new_file = self.mocker.mock_open().return_value
         mocked_open = self.mocker.patch(
             "railrailrail.config.open",
-            side_effect=[OSError, self.mocker.mock_open().return_value],
+            side_effect=[OSError, new_file],
         )  # Create new file if it is empty or does not exist.
         self.config_tel_3.update_network_config_file(config_file_path)
         assert mocked_open.call_count == 2
+        new_file.write.assert_called_once_with(
+            tomlkit.dumps(self.config_tel_3.make_network())
+        )